@@ -188,13 +188,13 @@ class ClingoExplaidApp(Application):
             if cc.minimal is None:
                 print("SATISFIABLE: Instance has no MUS")
                 return
-            if len(list(cc.minimal)) == 0:
+            if not cc.minimal:
                 print(
                     "NO MUS CONTAINED: The unsatisfiability of this program is not induced by the provided assumptions"
                 )
                 return
 
-            mus_string = " ".join(cc.mus_to_string(cc.minimal))
+            mus_string = " ".join(sorted(cc.mus_to_string(cc.minimal)))
             self._print_mus(mus_string)
 
             if compute_unsat_constraints:
@@ -216,7 +216,7 @@ class ClingoExplaidApp(Application):
                 n_mus = 0
                 for mus in cc.get_multiple_minimal(max_mus=max_models):
                     n_mus += 1
-                    mus_string = " ".join(cc.mus_to_string(mus))
+                    mus_string = " ".join(sorted(cc.mus_to_string(mus)))
                     self._print_mus(mus_string)
 
                     if compute_unsat_constraints:
@@ -241,31 +241,33 @@ class ClingoExplaidApp(Application):
     ) -> None:
         if prefix is None:
             prefix = ""
-        print(f"{prefix}{BACKGROUND_COLORS['RED']} Unsat Constraints {COLORS['NORMAL']}")
+        # the output is collected and printed at once, file links are resolved once per file
+        lines = [f"{prefix}{BACKGROUND_COLORS['RED']} Unsat Constraints {COLORS['NORMAL']}"]
+        file_links: Dict[str, str] = {}
         for cid, constraint in unsat_constraints.items():
             location = ucc.get_constraint_location(cid)
             if location is None:
                 warn(f"Couldn't find a corresponding file for constraint with id {cid}")
                 continue
             relative_file_path = location.begin.filename
-            absolute_file_path = str(Path(relative_file_path).absolute().resolve())
+            file_link = file_links.get(relative_file_path)
+            if file_link is None:
+                absolute_file_path = str(Path(relative_file_path).absolute().resolve())
+                file_link = "file://" + absolute_file_path
+                if " " in absolute_file_path:
+                    # If there's a space in the filename use a hyperlink
+                    file_link = HYPERLINK_MASK.format("", file_link, file_link)
+                file_links[relative_file_path] = file_link
             line_beginning = location.begin.line
             line_end = location.end.line
             line_string = (
                 f"Line {line_beginning}" if line_beginning == line_end else f"Lines {line_beginning}-{line_end}"
             )
-            file_link = "file://" + absolute_file_path
-            if " " in absolute_file_path:
-                # If there's a space in the filename use a hyperlink
-                file_link = HYPERLINK_MASK.format("", file_link, file_link)
-
-            if location is not None:
-                print(
-                    f"{prefix}{COLORS['RED']}{constraint}"
-                    f"{COLORS['GREY']} [ {file_link} ]({line_string}){COLORS['NORMAL']}"
-                )
-            else:
-                print(f"{prefix}{COLORS['RED']}{constraint}{COLORS['NORMAL']}")
+            lines.append(
+                f"{prefix}{COLORS['RED']}{constraint}"
+                f"{COLORS['GREY']} [ {file_link} ]({line_string}){COLORS['NORMAL']}"
+            )
+        print("\n".join(lines))
 
     def _method_unsat_constraints(
         self,
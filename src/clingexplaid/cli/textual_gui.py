@@ -5,6 +5,7 @@ Module for a Command Line based GUI for clingexplaid
 import argparse
 import asyncio
 import itertools
+import os
 import re
 from enum import Enum
 from pathlib import Path
@@ -42,6 +43,7 @@ from ..unsat_constraints import UnsatConstraintComputer
 from .textual_style import MAIN_CSS
 
 ACTIVE_CLASS = "active"
+DEBUG_ENVIRONMENT_VARIABLE = "CLINGEXPLAID_DEBUG"
 
 COLORS = {
     "BLACK": "#000000",
@@ -66,6 +68,8 @@ MODES = (
     Modes.MODE_SHOW_DECISIONS,
 )
 
+MODE_OPTIONS = tuple((mode.value, mode.value) for mode in MODES)
+
 
 class NoFilesException(Exception):
     """
@@ -83,6 +87,16 @@ class ModelType(Enum):
     MUS = 3
 
 
+MODEL_TYPE_NAMES = {model_type: model_type.name.replace("_", " ") for model_type in ModelType}
+
+# (name style, count style) of the model node labels for each model type
+MODEL_TYPE_STYLES = {
+    ModelType.MODEL: (f"{COLORS['BLACK']} on {COLORS['GRAY-LIGHT']}", f"{COLORS['BLACK']} on {COLORS['GRAY']}"),
+    ModelType.UNSAT_CONSTRAINT: ("#f27573 on #7c1313", "#f27573 on #610f0f"),
+    ModelType.MUS: ("#66bdff on #004578", "#66bdff on #003761"),
+}
+
+
 def read_file(path: Union[Path, str]) -> str:
     """
     Helper function to get the contents of a file as a string.
@@ -307,6 +321,10 @@ class Sidebar(Static):
         self.files = files
         self.constants = {} if constants is None else constants
         self.signatures = self.get_all_program_signatures()
+        # the signature labels only depend on the loaded files so they are computed once instead of on every compose
+        self.signature_labels = [INTERNAL_STRING] + [
+            f"{name} / {arity}" for name, arity in sorted(self.signatures, key=lambda x: x[0])
+        ]
 
     def get_all_program_signatures(self) -> Set[Tuple[str, int]]:
         """
@@ -330,8 +348,7 @@ class Sidebar(Static):
             # with TabPane("Constants", id="tab-constants"):
             #     yield ConstantsWidget(self.constants)
             with TabPane("Signatures", id="tab-signatures"):
-                sorted_signatures = list(sorted(self.signatures, key=lambda x: x[0]))
-                yield SignaturesWidget([INTERNAL_STRING] + [f"{name} / {arity}" for name, arity in sorted_signatures])
+                yield SignaturesWidget(self.signature_labels)
 
 
 class ControlPanel(Static):
@@ -347,7 +364,7 @@ class ControlPanel(Static):
         """
         yield Label("Mode")
         yield Select(
-            ((line.value, line.value) for line in MODES),
+            MODE_OPTIONS,
             allow_blank=False,
             id="mode-select",
         )
@@ -445,6 +462,7 @@ class ClingexplaidTextualApp(App[int]):
         self._config_show_internal = True
         self._loaded_files: Set[str] = set()
         self._loaded_signatures: Set[Tuple[str, int]] = set()
+        self._debug = bool(os.environ.get(DEBUG_ENVIRONMENT_VARIABLE))
 
         self.bind("ctrl+x", "exit", description="Exit", key_display="CTRL+X")
 
@@ -472,7 +490,8 @@ class ClingexplaidTextualApp(App[int]):
             ),
             id="content",
         )
-        yield Label(id="debug")
+        if self._debug:
+            yield Label(id="debug")
         yield Footer()
 
     def action_exit(self) -> None:
@@ -596,7 +615,7 @@ class ClingexplaidTextualApp(App[int]):
 
         for mus in cc.get_multiple_minimal(max_mus=self._config_model_number):
             self.model_count += 1
-            mus_string = " ".join(cc.mus_to_string(mus))
+            mus_string = " ".join(sorted(cc.mus_to_string(mus)))
             await self.add_model_node(mus_string, ModelType.MUS)
 
         if not self.model_count:
@@ -765,24 +784,18 @@ class ClingexplaidTextualApp(App[int]):
         """
         Adds a model node of type model_type to the solver tree
         """
-        match model_type:
-            case ModelType.MODEL:
-                color_fg, color_bg_1, color_bg_2 = (COLORS["BLACK"], COLORS["GRAY-LIGHT"], COLORS["GRAY"])
-            case ModelType.UNSAT_CONSTRAINT:
-                color_fg, color_bg_1, color_bg_2 = ("#f27573", "#7c1313", "#610f0f")
-            case ModelType.MUS:
-                color_fg, color_bg_1, color_bg_2 = ("#66bdff", "#004578", "#003761")
-            case _:
-                raise ValueError("Model type not supported")
-
-        model_name = model_type.name.replace("_", " ")
+        if model_type not in MODEL_TYPE_STYLES:
+            raise ValueError("Model type not supported")
+        name_style, count_style = MODEL_TYPE_STYLES[model_type]
+
         tree_cursor = await self.get_tree_cursor()
-        model_node = tree_cursor.add(f" {model_name}  {self.model_count}  {value}")
-        cast(Text, model_node.label).stylize(f"{color_fg} on {color_bg_1}", 0, len(model_name) + 2)
-        cast(Text, model_node.label).stylize(
-            f"{color_fg} on {color_bg_2}", len(model_name) + 2, len(model_name) + 4 + len(str(self.model_count))
+        # the label is assembled in a single pass instead of being parsed as markup and restyled afterward
+        label = Text.assemble(
+            (f" {MODEL_TYPE_NAMES[model_type]} ", name_style),
+            (f" {self.model_count} ", count_style),
+            f" {value}",
         )
-        return model_node
+        return tree_cursor.add(label)
 
     async def reset_tree_cursor(self) -> None:
         """
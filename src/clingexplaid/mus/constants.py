@@ -0,0 +1,5 @@
+"""
+Constant definitions for the mus package
+"""
+
+EXPLORER_ATOM_NAME = "_explore"
@@ -2,13 +2,13 @@
 MUS Module: Core Computer to get Minimal Unsatisfiable Subsets
 """
 
-from itertools import chain, combinations
-from typing import Dict, Generator, List, Optional, Set, Tuple
+from typing import Dict, FrozenSet, Generator, List, Optional, Set, Tuple, cast
 
 import clingo
 
 from ..utils import get_solver_literal_lookup
-from ..utils.types import Assumption, AssumptionSet, SymbolSet
+from ..utils.types import Assumption, AssumptionSet
+from .explorer import Explorer
 
 
 class CoreComputer:
@@ -17,63 +17,173 @@ class CoreComputer:
     core.
     """
 
+    # pylint: disable=too-many-instance-attributes
+
     def __init__(self, control: clingo.Control, assumption_set: AssumptionSet):
         self.control = control
         self.assumption_set = assumption_set
-        self.literal_lookup = get_solver_literal_lookup(control=self.control)
+        self._literal_lookup: Optional[Dict[int, clingo.Symbol]] = None
+        # solver literals of the symbolic assumptions, so they don't have to be looked up again for every solver call
+        # (`None` for symbols that aren't part of the program)
+        self._assumption_literals: Dict[Assumption, Optional[int]] = {}
         self.minimal: Optional[AssumptionSet] = None
+        # results of already solved assumption sets (only valid as long as the control isn't changed): `None` for
+        # satisfiable sets and the unsatisfiable core (as a subset of the passed assumptions) for unsatisfiable ones
+        self._core_cache: Dict[FrozenSet[Assumption], Optional[FrozenSet[Assumption]]] = {}
+        # solved satisfiable assumption sets and unsatisfiable cores, every subset of the former is satisfiable and
+        # every superset of the latter is unsatisfiable
+        self._sat_sets: List[FrozenSet[Assumption]] = []
+        self._unsat_cores: List[FrozenSet[Assumption]] = []
+
+    @property
+    def literal_lookup(self) -> Dict[int, clingo.Symbol]:
+        """
+        Lookup from solver literals to their symbols. It is only built on first use, since it requires a traversal of
+        all symbolic atoms and isn't needed when the assumptions are given as symbols.
+        """
+        if self._literal_lookup is None:
+            self._literal_lookup = get_solver_literal_lookup(control=self.control)
+        return self._literal_lookup
+
+    def refresh_lookup(self) -> None:
+        """
+        Discards the literal lookups, so they are rebuilt on next use, as well as all cached satisfiability results.
+        This has to be called after the control is grounded again.
+        """
+        self._literal_lookup = None
+        self._assumption_literals = {}
+        self._core_cache = {}
+        self._sat_sets = []
+        self._unsat_cores = []
 
-    def _solve(self, assumptions: Optional[AssumptionSet] = None) -> Tuple[bool, SymbolSet, SymbolSet]:
+    def _is_satisfiable(self, assumptions: Optional[AssumptionSet] = None) -> bool:
         """
-        Internal function that is used to make the single solver calls for finding the minimal unsatisfiable subset.
+        Internal function that checks if the program is satisfiable under the provided assumptions. The search stops
+        as soon as the first model is found. The results are cached, so every distinct assumption set is only solved
+        once. Additionally, subsets of known satisfiable assumption sets and supersets of known unsatisfiable cores are
+        decided without calling the solver.
         """
         if assumptions is None:
             assumptions = self.assumption_set
 
-        with self.control.solve(assumptions=list(assumptions), yield_=True) as solve_handle:
-            satisfiable = bool(solve_handle.get().satisfiable)
-            model = solve_handle.model().symbols(atoms=True) if solve_handle.model() is not None else []
-            core = {self.literal_lookup[literal_id] for literal_id in solve_handle.core()}
+        key = frozenset(assumptions)
+        if key in self._core_cache:
+            return self._core_cache[key] is None
+
+        core = next((unsat_core for unsat_core in self._unsat_cores if unsat_core.issubset(key)), None)
+        if core is None and not any(key.issubset(sat_set) for sat_set in self._sat_sets):
+            literals = {assumption: self._assumption_literal(assumption) for assumption in key}
+            # a positive assumption of a symbol that isn't part of the program can never hold, so it is an
+            # unsatisfiable core on its own, while a negative one always holds and is left out of the solver call
+            unknown = next(
+                (
+                    assumption
+                    for assumption, literal in literals.items()
+                    if literal is None and cast(Tuple[clingo.Symbol, bool], assumption)[1]
+                ),
+                None,
+            )
+            if unknown is not None:
+                core = frozenset({unknown})
+            else:
+                known_literals = [literal for literal in literals.values() if literal is not None]
+                with self.control.solve(assumptions=known_literals, yield_=True) as solve_handle:
+                    if solve_handle.get().satisfiable:
+                        # only the maximal satisfiable sets are kept, since their subsets are covered
+                        self._sat_sets = [sat_set for sat_set in self._sat_sets if not sat_set.issubset(key)]
+                        self._sat_sets.append(key)
+                    else:
+                        core = self._core_to_assumptions(solve_handle.core(), key)
+            if core is not None:
+                # only the minimal cores are kept, since their supersets are covered
+                self._unsat_cores = [unsat_core for unsat_core in self._unsat_cores if not core.issubset(unsat_core)]
+                self._unsat_cores.append(core)
+        self._core_cache[key] = core
+        return core is None
+
+    def _unsat_core(self, assumptions: AssumptionSet) -> FrozenSet[Assumption]:
+        """
+        Internal function that returns the subset of the provided unsatisfiable assumptions that is part of the
+        unsatisfiable core reported by the solver. The returned subset is unsatisfiable itself.
+        """
+        key = frozenset(assumptions)
+        if self._is_satisfiable(assumptions=key):
+            raise ValueError("An unsatisfiable core cannot be computed for a satisfiable assumption set")
+        return cast(FrozenSet[Assumption], self._core_cache[key])
 
-        return satisfiable, set(model), core
+    def _core_to_assumptions(self, core: List[int], assumptions: FrozenSet[Assumption]) -> FrozenSet[Assumption]:
+        """
+        Internal function that maps the literals of a solver core back to the assumptions they originate from.
+        """
+        core_literals = set(core)
+        return frozenset(
+            assumption for assumption in assumptions if self._assumption_literal(assumption) in core_literals
+        )
+
+    def _assumption_literal(self, assumption: Assumption) -> Optional[int]:
+        """
+        Internal function that returns the solver literal of an assumption or `None` if the symbol of the assumption
+        isn't part of the program.
+        """
+        if isinstance(assumption, int):
+            return assumption
+        if assumption not in self._assumption_literals:
+            symbol, positive = assumption
+            symbolic_atom = self.control.symbolic_atoms[symbol]
+            literal = None
+            if symbolic_atom is not None:
+                literal = symbolic_atom.literal if positive else -symbolic_atom.literal
+            self._assumption_literals[assumption] = literal
+        return self._assumption_literals[assumption]
 
     def _compute_single_minimal(self, assumptions: Optional[AssumptionSet] = None) -> AssumptionSet:
         """
         Function to compute a single minimal unsatisfiable subset from the passed set of assumptions and the program of
         the CoreComputer. If there is no minimal unsatisfiable subset, since for example the program with assumptions
         assumed is satisfiable, an empty set is returned. The algorithm that is used to compute this minimal
-        unsatisfiable core is the iterative deletion algorithm.
+        unsatisfiable core is QuickXplain, starting from the unsatisfiable core reported by the solver.
         """
         if assumptions is None:
             assumptions = self.assumption_set
+        # materialize the assumptions once, so they can be iterated multiple times in a stable order
+        assumption_list = list(assumptions)
 
         # check that the assumption set isn't empty
-        if not assumptions:
+        if not assumption_list:
             raise ValueError("A minimal unsatisfiable subset cannot be computed on an empty assumption set")
 
         # check if the problem with the full assumption set is unsatisfiable in the first place, and if not skip the
         # rest of the algorithm and return an empty set.
-        satisfiable, _, _ = self._solve(assumptions=assumptions)
-        if satisfiable:
+        if self._is_satisfiable(assumptions=assumption_list):
             return set()
 
-        mus_members: Set[Assumption] = set()
-        working_set = set(assumptions)
+        # only the assumptions of the solver's core have to be considered, since the core is unsatisfiable by itself
+        core = self._unsat_core(assumption_list)
+        candidates = [assumption for assumption in assumption_list if assumption in core]
+        return self._quickxplain(frozenset(), candidates)
 
-        for assumption in assumptions:
-            # remove the current assumption from the working set
-            working_set.remove(assumption)
-
-            satisfiable, _, _ = self._solve(assumptions=working_set.union(mus_members))
-            # if the working set now becomes satisfiable without the assumption it is added to the mus_members
-            if satisfiable:
-                mus_members.add(assumption)
-                # every time we discover a new mus member we also check if all currently found mus members already
-                # suffice to make the instance unsatisfiable. If so we can stop the search sice we found our mus.
-                if not self._solve(assumptions=mus_members)[0]:
-                    break
-
-        return mus_members
+    def _quickxplain(
+        self, background: FrozenSet[Assumption], candidates: List[Assumption], check_background: bool = False
+    ) -> Set[Assumption]:
+        """
+        Internal function implementing the QuickXplain algorithm. Given that the `background` assumptions together
+        with the `candidates` are unsatisfiable, a minimal subset of the `candidates` is returned that is unsatisfiable
+        together with the `background`. The candidates are halved recursively, so only O(k log(n/k)) solver calls are
+        needed for a minimal subset of size k out of n candidates.
+        """
+        # the background alone is unsatisfiable, so no further candidate is required
+        if check_background and not self._is_satisfiable(assumptions=background):
+            return set()
+        if len(candidates) <= 1:
+            return set(candidates)
+
+        split = len(candidates) // 2
+        first, second = candidates[:split], candidates[split:]
+        second_minimal = self._quickxplain(background.union(first), second, check_background=True)
+        first_minimal = self._quickxplain(
+            background.union(second_minimal), first, check_background=bool(second_minimal)
+        )
+        return first_minimal.union(second_minimal)
 
     def shrink(self, assumptions: Optional[AssumptionSet] = None) -> None:
         """
@@ -89,52 +199,40 @@ class CoreComputer:
         fully complete in reasonable time. The parameter `max_mus` can be used to specify the maximum number of
         mus that are found before stopping the search.
         """
-        assumptions = self.assumption_set
-        assumption_powerset = chain.from_iterable(
-            combinations(assumptions, r) for r in reversed(range(len(list(assumptions)) + 1))
-        )
+        explorer = Explorer(self.assumption_set)
+        n_mus = 0
 
-        found_sat: List[AssumptionSet] = []
-        found_mucs: List[AssumptionSet] = []
+        for candidate in explorer.candidates():
+            mus = self._compute_single_minimal(assumptions=candidate)
 
-        for current_subset in (set(s) for s in assumption_powerset):
-            # skip if empty subset
-            if len(current_subset) == 0:
-                continue
-            # skip if an already found satisfiable subset is superset
-            if any(set(sat).issuperset(current_subset) for sat in found_sat):
-                continue
-            # skip if an already found muc is a subset
-            if any(set(muc).issubset(current_subset) for muc in found_mucs):
+            # if the candidate wasn't unsatisfiable all of its subsets are satisfiable too
+            if not mus:
+                explorer.add_sat(candidate)
                 continue
 
-            muc = self._compute_single_minimal(assumptions=current_subset)
-
-            # if the current subset wasn't unsatisfiable store this info and continue
-            if len(list(muc)) == 0:
-                found_sat.append(current_subset)
-                continue
-
-            # if iterative deletion finds a muc that wasn't discovered before update sets and yield
-            if muc not in found_mucs:
-                found_mucs.append(muc)
-                yield muc
-                # if the maximum muc amount is found stop search
-                if max_mus is not None and len(found_mucs) == max_mus:
-                    break
+            # the candidate contains no known mus, so the one found by the shrinking is always new
+            explorer.add_mus(mus)
+            yield mus
+            n_mus += 1
+            # if the maximum mus amount is found stop search
+            if max_mus is not None and n_mus == max_mus:
+                break
 
     def mus_to_string(self, muc: AssumptionSet, literal_lookup: Optional[Dict[int, clingo.Symbol]] = None) -> Set[str]:
         """
         Converts a MUS into a set containing the string representations of the contained assumptions
         """
-        # take class literal_lookup as default if no other is provided
-        if literal_lookup is None:
-            literal_lookup = self.literal_lookup
-
         mus_string = set()
+        literals = []
         for a in muc:
             if isinstance(a, int):
-                mus_string.add(str(literal_lookup[a]))
+                literals.append(a)
             else:
                 mus_string.add(str(a[0]))
+
+        if literals:
+            # take class literal_lookup as default if no other is provided
+            if literal_lookup is None:
+                literal_lookup = self.literal_lookup
+            mus_string.update(str(literal_lookup[literal]) for literal in literals)
         return mus_string
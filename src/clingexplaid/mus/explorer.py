@@ -0,0 +1,72 @@
+"""
+MUS Module: Explorer to keep track of the already explored assumption subsets
+"""
+
+from typing import Dict, Generator, Iterable, List, Set
+
+import clingo
+from clingo.backend import HeuristicType
+
+from ..utils.types import Assumption, AssumptionSet
+from .constants import EXPLORER_ATOM_NAME
+
+
+class Explorer:
+    """
+    Keeps track of the explored subsets of an assumption set using a separate clingo map program, which contains one
+    atom per assumption. Satisfiable subsets block all of their subsets and minimal unsatisfiable subsets block all of
+    their supersets. Every model of the map program is thus an unexplored subset, and due to the domain heuristic it
+    is a subset maximal one.
+    """
+
+    def __init__(self, assumptions: AssumptionSet):
+        # duplicates are removed (keeping the order), so every assumption has exactly one map atom
+        self._assumptions: List[Assumption] = list(dict.fromkeys(assumptions))
+        self._control = clingo.Control(["--heuristic=Domain"])
+
+        with self._control.backend() as backend:
+            atoms = [
+                backend.add_atom(clingo.Function(EXPLORER_ATOM_NAME, [clingo.Number(i)]))
+                for i in range(len(self._assumptions))
+            ]
+            backend.add_rule(atoms, choice=True)
+            # prefer assumptions to be included so the computed subsets are subset maximal
+            for atom in atoms:
+                backend.add_heuristic(atom, HeuristicType.True_, 1, 1, [])
+
+        self._atom_lookup: Dict[Assumption, int] = dict(zip(self._assumptions, atoms))
+
+    def add_sat(self, assumptions: Iterable[Assumption]) -> None:
+        """
+        Marks the satisfiable subset `assumptions` and all of its subsets as explored.
+        """
+        satisfiable = set(assumptions)
+        # at least one assumption outside the satisfiable subset has to be chosen
+        body = [-atom for assumption, atom in self._atom_lookup.items() if assumption not in satisfiable]
+        with self._control.backend() as backend:
+            backend.add_rule([], body)
+
+    def add_mus(self, assumptions: Iterable[Assumption]) -> None:
+        """
+        Marks the minimal unsatisfiable subset `assumptions` and all of its supersets as explored.
+        """
+        body = [self._atom_lookup[assumption] for assumption in assumptions]
+        with self._control.backend() as backend:
+            backend.add_rule([], body)
+
+    def candidates(self) -> Generator[Set[Assumption], None, None]:
+        """
+        Generates unexplored assumption subsets until the whole powerset is explored. Every yielded candidate has to be
+        marked as explored using `add_sat` or `add_mus` before the next one is requested.
+        """
+        while True:
+            with self._control.solve(yield_=True) as solve_handle:
+                model = solve_handle.model()
+                if model is None:
+                    return
+                candidate = {self._assumptions[atom.arguments[0].number] for atom in model.symbols(atoms=True)}
+            # the empty set can't contain a MUS, so it is excluded like a satisfiable subset
+            if not candidate:
+                self.add_sat(candidate)
+                continue
+            yield candidate
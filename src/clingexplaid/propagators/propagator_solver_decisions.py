@@ -3,7 +3,7 @@ Propagator Module: Decision Order
 """
 
 from dataclasses import dataclass
-from typing import Callable, Dict, List, Optional, Sequence, Set, Tuple, Union
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Set, Tuple, Union
 
 import clingo
 from clingo import Propagator
@@ -19,6 +19,9 @@ class Decision:
     Dataclass representing a solver decision
     """
 
+    # a decision is created for every literal on every propagation step, slots avoid a `__dict__` per instance
+    __slots__ = ("positive", "literal", "symbol")
+
     positive: bool
     literal: int
     symbol: Optional[clingo.Symbol]
@@ -28,14 +31,15 @@ class Decision:
         Checks if the decisions symbol matches any of the provided `signatures`. If  the decisions is an internal
         literal `show_internal` is returned.
         """
-        if self.symbol is not None:
-            for sig, arity in signatures:
-                if self.symbol.match(sig, arity):
-                    return True
-        else:
+        if self.symbol is None:
             # show internal is show_internal is True
             return show_internal
-        return False
+        # like `clingo.Symbol.match` only positive functions can match, their signature is looked up in the set
+        return (
+            self.symbol.type == clingo.SymbolType.Function
+            and self.symbol.positive
+            and (self.symbol.name, len(self.symbol.arguments)) in signatures
+        )
 
     def __str__(self) -> str:
         symbol_string = str(self.symbol) if self.symbol is not None else INTERNAL_STRING
@@ -64,6 +68,8 @@ class SolverDecisionPropagator(Propagator):
         self.callback_undo: Callable[[], None] = callback_undo if callback_undo is not None else lambda: None
 
         self.last_decisions: List[Union[Decision, List[Decision]]] = []
+        # decisions only depend on the signed literal, so one shared instance is kept per literal
+        self._decision_lookup: Dict[int, Decision] = {}
 
     def init(self, init: clingo.PropagateInit) -> None:
         """
@@ -73,15 +79,17 @@ class SolverDecisionPropagator(Propagator):
             program_literal = atom.literal
             solver_literal = init.solver_literal(program_literal)
             self.literal_symbol_lookup[solver_literal] = atom.symbol
+        self._decision_lookup = {}
 
-        for atom in init.symbolic_atoms:
-            if len(self.signatures) > 0 and not any(atom.match(name=s, arity=a) for s, a in self.signatures):
-                continue
-            symbolic_atom = init.symbolic_atoms[atom.symbol]
-            if symbolic_atom is None:
-                continue  # nocoverage
-            query_program_literal = symbolic_atom.literal
-            query_solver_literal = init.solver_literal(query_program_literal)
+        # if signatures are given only the atoms of these signatures are watched, else all atoms are watched
+        if self.signatures:
+            watched_atoms: Iterable[clingo.SymbolicAtom] = (
+                atom for name, arity in self.signatures for atom in init.symbolic_atoms.by_signature(name, arity)
+            )
+        else:
+            watched_atoms = init.symbolic_atoms
+        for atom in watched_atoms:
+            query_solver_literal = init.solver_literal(atom.literal)
             init.add_watch(query_solver_literal)
             init.add_watch(-query_solver_literal)
 
@@ -126,9 +134,13 @@ class SolverDecisionPropagator(Propagator):
         """
         Converts a literal integer to a `Decision` object.
         """
-        is_positive = literal >= 0
-        symbol = self.literal_symbol_lookup.get(abs(literal))
-        return Decision(literal=abs(literal), positive=is_positive, symbol=symbol)
+        decision = self._decision_lookup.get(literal)
+        if decision is None:
+            is_positive = literal >= 0
+            symbol = self.literal_symbol_lookup.get(abs(literal))
+            decision = Decision(literal=abs(literal), positive=is_positive, symbol=symbol)
+            self._decision_lookup[literal] = decision
+        return decision
 
     def literal_to_decision_sequence(
         self, literal_sequence: List[Union[int, List[int]]]
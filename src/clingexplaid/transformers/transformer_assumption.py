@@ -8,7 +8,7 @@ from typing import Dict, List, Optional, Sequence, Set, Tuple, Union
 import clingo
 import clingo.ast as _ast
 
-from ..utils import get_constant_string, match_ast_symbolic_atom_signature
+from ..utils import get_ast_symbolic_atom_signature, get_constant_string
 from .exceptions import NotGroundedException, UntransformedException
 
 
@@ -32,11 +32,8 @@ class AssumptionTransformer(_ast.Transformer):
             return node
         if node.body:
             return node
-        has_matching_signature = any(
-            match_ast_symbolic_atom_signature(node.head.atom, (name, arity)) for (name, arity) in self.signatures
-        )
         # if signatures are defined only transform facts that match them, else transform all facts
-        if self.signatures and not has_matching_signature:
+        if self.signatures and get_ast_symbolic_atom_signature(node.head.atom) not in self.signatures:
             return node
 
         self.fact_rules.append(str(node))
@@ -34,7 +34,7 @@ class ConstraintTransformer(_ast.Transformer):
 
         arguments = []
         if self._include_id:
-            arguments = [_ast.SymbolicTerm(node.location, clingo.parse_term(str(self._constraint_id)))]
+            arguments = [_ast.SymbolicTerm(node.location, clingo.Number(self._constraint_id))]
 
         head_symbol = _ast.Function(
             location=node.location,
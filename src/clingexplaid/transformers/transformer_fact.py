@@ -3,12 +3,12 @@ Transformer Module: Fact Remover
 """
 
 from pathlib import Path
-from typing import Optional, Sequence, Set, Tuple, Union
+from typing import List, Optional, Sequence, Set, Tuple, Union
 
 import clingo
 from clingo import ast
 
-from ..utils import match_ast_symbolic_atom_signature
+from ..utils import get_ast_symbolic_atom_signature
 from .constants import REMOVED_TOKEN
 
 
@@ -30,11 +30,8 @@ class FactTransformer(ast.Transformer):
             return node
         if node.body:
             return node
-        has_matching_signature = any(
-            match_ast_symbolic_atom_signature(node.head.atom, (name, arity)) for (name, arity) in self.signatures
-        )
         # if signatures are defined only transform facts that match them, else transform all facts
-        if self.signatures and not has_matching_signature:
+        if self.signatures and get_ast_symbolic_atom_signature(node.head.atom) not in self.signatures:
             return node
 
         return ast.Rule(
@@ -43,35 +40,30 @@ class FactTransformer(ast.Transformer):
             body=[],
         )
 
-    @staticmethod
-    def post_transform(program_string: str) -> str:
+    def _add_statement(self, statement: ast.AST, out: List[str]) -> None:
         """
-        Helper function that is called after the transformation process for cleanup purposes
+        Helper function that transforms a single statement and adds it to `out` unless it is a removed fact
         """
-        # remove the transformed REMOVED_TOKENS from the resulting program string
-        rules = program_string.split("\n")
-        out = []
-        for rule in rules:
-            if not rule.startswith(REMOVED_TOKEN):
-                out.append(rule)
-        return "\n".join(out)
+        transformed = str(self(statement))
+        if not transformed.startswith(REMOVED_TOKEN):
+            out.append(transformed)
 
     def parse_string(self, string: str) -> str:
         """
         Function that applies the transformation to the `program_string` it's called with and returns the transformed
         program string.
         """
-        out = []
-        ast.parse_string(string, lambda stm: out.append(str(self(stm))))
-        return self.post_transform("\n".join(out))
+        out: List[str] = []
+        ast.parse_string(string, lambda stm: self._add_statement(stm, out))
+        return "\n".join(out)
 
     def parse_files(self, paths: Sequence[Union[str, Path]]) -> str:
         """
         Parses the files and returns a string with the transformed program.
         """
-        out = []
+        out: List[str] = []
         ast.parse_files(
             [str(p) for p in paths],
-            lambda stm: out.append(str(self(stm))),
+            lambda stm: self._add_statement(stm, out),
         )
-        return self.post_transform("\n".join(out))
+        return "\n".join(out)
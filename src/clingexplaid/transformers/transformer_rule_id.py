@@ -32,7 +32,7 @@ class RuleIDTransformer(_ast.Transformer):
         symbol = _ast.Function(
             location=node.location,
             name=self.rule_id_signature,
-            arguments=[_ast.SymbolicTerm(node.location, clingo.parse_term(str(self.rule_id)))],
+            arguments=[_ast.SymbolicTerm(node.location, clingo.Number(self.rule_id))],
             external=0,
         )
 
@@ -75,4 +75,7 @@ class RuleIDTransformer(_ast.Transformer):
         """
         if n_rules is None:
             n_rules = self._get_number_of_rules()
-        return {(clingo.parse_term(f"{self.rule_id_signature}({rule_id})"), True) for rule_id in range(1, n_rules + 1)}
+        return {
+            (clingo.Function(self.rule_id_signature, [clingo.Number(rule_id)]), True)
+            for rule_id in range(1, n_rules + 1)
+        }
@@ -51,7 +51,7 @@ class RuleSplitter(_ast.Transformer):
 
             # create a new '_body' head for the original rule
             new_head_arguments = [
-                _ast.SymbolicTerm(node.location, clingo.parse_term(f'"{rule_body_base64}"')),
+                _ast.SymbolicTerm(node.location, clingo.String(rule_body_base64)),
                 _ast.Function(
                     location=node.location,
                     name="",
@@ -12,6 +12,8 @@ from ..transformers import ConstraintTransformer, FactTransformer, OptimizationR
 from ..utils import get_signatures_from_model_string
 from .constants import UNSAT_CONSTRAINT_SIGNATURE
 
+UNSAT_CONSTRAINT_ID_PATTERN = re.compile(f"{UNSAT_CONSTRAINT_SIGNATURE}[(]([1-9][0-9]*)[)]")
+
 
 class UnsatConstraintComputer:
     """
@@ -91,14 +93,11 @@ class UnsatConstraintComputer:
         # create a rule lookup for every constraint in the program associated with it's unsat id
         constraint_lookup = {}
         for line in program_string.split("\n"):
-            id_re = re.compile(f"{UNSAT_CONSTRAINT_SIGNATURE}[(]([1-9][0-9]*)[)]")
-            match_result = id_re.match(line)
+            match_result = UNSAT_CONSTRAINT_ID_PATTERN.match(line)
             if match_result is None:
                 continue
-            constraint_id = match_result.group(1)
-            constraint_lookup[int(constraint_id)] = (
-                str(line).replace(f"{UNSAT_CONSTRAINT_SIGNATURE}({constraint_id})", "").strip()
-            )
+            # the id atom is matched at the beginning of the line, so the constraint is the rest of the line
+            constraint_lookup[int(match_result.group(1))] = line[match_result.end() :].strip()
 
         self.control.add("base", [], program_string)
         self.control.ground([("base", [])])
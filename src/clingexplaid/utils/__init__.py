@@ -8,6 +8,28 @@ from typing import Dict, List, Set, Tuple
 import clingo
 from clingo.ast import ASTType
 
+SIGNATURE_NAME_PATTERN = re.compile(r"([^(]*)\(")
+ARITY_TOKEN_PATTERN = re.compile(r"[(),]")
+
+
+def get_ast_symbolic_atom_signature(ast_symbol: ASTType.SymbolicAtom) -> Tuple[str, int]:
+    """
+    Function to get the signature of an AST SymbolicAtom as a tuple containing its name and arity.
+    """
+
+    symbol = ast_symbol.symbol
+    # classically negated atoms are unary operations, their name and arity are the ones of the negated term
+    if symbol.ast_type == ASTType.UnaryOperation:
+        symbol = symbol.argument
+    # the name of functions can be read directly, only other terms (like pools) have to be converted to a string
+    if symbol.ast_type == ASTType.Function:
+        name = symbol.name
+    else:
+        name = str(symbol).split("(", maxsplit=1)[0]
+    arity = len(symbol.arguments)
+
+    return name, arity
+
 
 def match_ast_symbolic_atom_signature(ast_symbol: ASTType.SymbolicAtom, signature: Tuple[str, int]) -> bool:
     """
@@ -15,9 +37,7 @@ def match_ast_symbolic_atom_signature(ast_symbol: ASTType.SymbolicAtom, signatur
     matching signature.
     """
 
-    symbol = str(ast_symbol.symbol)
-    name = symbol.split("(", maxsplit=1)[0]
-    arity = len(ast_symbol.symbol.arguments)
+    name, arity = get_ast_symbolic_atom_signature(ast_symbol)
 
     return all((signature[0] == name, signature[1] == arity))
 
@@ -27,13 +47,11 @@ def get_solver_literal_lookup(control: clingo.Control) -> Dict[int, clingo.Symbo
     This function can be used to get a lookup dictionary to associate literal ids with their respective symbols for all
     symbolic atoms of the program
     """
-    lookup = {}
-    for atom in control.symbolic_atoms:
-        lookup[atom.literal] = atom.symbol
-    return lookup
+    return {atom.literal: atom.symbol for atom in control.symbolic_atoms}
 
 
 __all__ = [
+    get_ast_symbolic_atom_signature.__name__,
     match_ast_symbolic_atom_signature.__name__,
     get_solver_literal_lookup.__name__,
 ]
@@ -46,15 +64,16 @@ def get_signatures_from_model_string(model_string: str) -> Set[Tuple[str, int]]:
     """
     signatures = set()
     for atom_string in model_string.split():
-        result = re.search(r"([^(]*)\(", atom_string)
+        result = SIGNATURE_NAME_PATTERN.match(atom_string)
         if result is None:
             signatures.add((atom_string, 0))
             continue
         signature = result.group(1)
-        # calculate arity for the signature
+        # calculate arity for the signature, only parentheses and commas are relevant so all other characters are
+        # skipped by the regex scan
         arity = 0
         level = 0
-        for c in atom_string.removeprefix(signature):
+        for c in ARITY_TOKEN_PATTERN.findall(atom_string, len(signature)):
             if c == "(":
                 level += 1
             elif c == ")":
@@ -9,6 +9,7 @@ from unittest import TestCase
 import clingo
 
 from clingexplaid.mus import CoreComputer
+from clingexplaid.mus.explorer import Explorer
 from clingexplaid.transformers import AssumptionTransformer
 from clingexplaid.utils.types import AssumptionSet
 
@@ -231,17 +232,169 @@ class TestMUS(TestCase):
 
         self.assertEqual(len(mus_string_sets), 2)
 
+    def test_explorer_candidates(self) -> None:
+        """
+        Test the Explorer's `candidates` function with explored satisfiable and unsatisfiable subsets.
+        """
+
+        explorer = Explorer([1, 2, 3])
+        candidates = explorer.candidates()
+
+        # the first candidate is the full set since nothing is explored yet
+        self.assertEqual(next(candidates), {1, 2, 3})
+        explorer.add_mus({1, 2})
+        candidate = next(candidates)
+        self.assertIn(candidate, [{1, 3}, {2, 3}])
+        explorer.add_sat(candidate)
+        other_candidate = {1, 3} if candidate == {2, 3} else {2, 3}
+        self.assertEqual(next(candidates), other_candidate)
+        explorer.add_sat(other_candidate)
+        # all remaining subsets are subsets of the satisfiable ones
+        self.assertEqual(list(candidates), [])
+
+    def test_core_computer_get_multiple_minimal_duplicate_assumptions(self) -> None:
+        """
+        Test the CoreComputer's `get_multiple_minimal` function with duplicate assumptions.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a; b}. :- a.")
+        control.ground([("base", [])])
+        a, b = ((clingo.parse_term(c), True) for c in "ab")
+        cc = CoreComputer(control, [a, a, b])
+        self.assertEqual(list(cc.get_multiple_minimal()), [{a}])
+        self.assertEqual(list(cc.get_multiple_minimal(max_mus=5)), [{a}])
+
     # INTERNAL
 
-    def test_core_computer_internal_solve_no_assumptions(self) -> None:
+    def test_core_computer_internal_is_satisfiable_no_assumptions(self) -> None:
         """
-        Test the CoreComputer's `_solve` function with no assumptions.
+        Test the CoreComputer's `_is_satisfiable` function with no assumptions.
         """
 
         control = clingo.Control()
         cc = CoreComputer(control, set())
-        satisfiable, _, _ = cc._solve()  # pylint: disable=W0212
-        self.assertTrue(satisfiable)
+        self.assertTrue(cc._is_satisfiable())  # pylint: disable=W0212
+
+    def test_core_computer_internal_is_satisfiable(self) -> None:
+        """
+        Test the CoreComputer's `_is_satisfiable` function with satisfiable and unsatisfiable assumptions.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a; b}. :- a, b.")
+        control.ground([("base", [])])
+        assumptions = {(clingo.parse_term(c), True) for c in "ab"}
+        cc = CoreComputer(control, assumptions)
+        self.assertFalse(cc._is_satisfiable())  # pylint: disable=W0212
+        self.assertTrue(cc._is_satisfiable({(clingo.parse_term("a"), True)}))  # pylint: disable=W0212
+
+    def test_core_computer_internal_is_satisfiable_cache(self) -> None:
+        """
+        Test that the CoreComputer's `_is_satisfiable` function caches results by assumption set.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a; b}. :- a, b.")
+        control.ground([("base", [])])
+        a, b = ((clingo.parse_term(c), True) for c in "ab")
+        cc = CoreComputer(control, {a, b})
+        cc._is_satisfiable([a, b])  # pylint: disable=W0212
+        cc._is_satisfiable([b, a])  # pylint: disable=W0212
+        cc._is_satisfiable([a])  # pylint: disable=W0212
+        self.assertEqual(set(cc._core_cache), {frozenset({a, b}), frozenset({a})})  # pylint: disable=W0212
+        self.assertIsNone(cc._core_cache[frozenset({a})])  # pylint: disable=W0212
+
+    def test_core_computer_internal_is_satisfiable_subsumption(self) -> None:
+        """
+        Test that the CoreComputer's `_is_satisfiable` function decides supersets of unsatisfiable cores and subsets of
+        satisfiable assumption sets without solving.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a; b; c}. :- a, b.")
+        control.ground([("base", [])])
+        a, b, c = ((clingo.parse_term(x), True) for x in "abc")
+        cc = CoreComputer(control, {a, b, c})
+        self.assertFalse(cc._is_satisfiable([a, b]))  # pylint: disable=W0212
+        self.assertTrue(cc._is_satisfiable([a, c]))  # pylint: disable=W0212
+        self.assertFalse(cc._is_satisfiable([a, b, c]))  # pylint: disable=W0212
+        self.assertTrue(cc._is_satisfiable([c]))  # pylint: disable=W0212
+        self.assertEqual(cc._unsat_core([a, b, c]), cc._unsat_core([a, b]))  # pylint: disable=W0212
+        self.assertEqual(len(cc._unsat_cores), 1)  # pylint: disable=W0212
+        self.assertEqual(len(cc._sat_sets), 1)  # pylint: disable=W0212
+
+    def test_core_computer_internal_quickxplain(self) -> None:
+        """
+        Test the CoreComputer's `_quickxplain` function with and without background assumptions.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a; b; c; d}. :- a, c. :- b, c, d.")
+        control.ground([("base", [])])
+        a, b, c, d = ((clingo.parse_term(x), True) for x in "abcd")
+        cc = CoreComputer(control, {a, b, c, d})
+        self.assertEqual(cc._quickxplain(frozenset(), [a, b, c, d]), {a, c})  # pylint: disable=W0212
+        self.assertEqual(cc._quickxplain(frozenset({c}), [b, d]), {b, d})  # pylint: disable=W0212
+        # the background alone is already unsatisfiable
+        minimal = cc._quickxplain(frozenset({a, c}), [b, d], check_background=True)  # pylint: disable=W0212
+        self.assertEqual(minimal, set())
+
+    def test_core_computer_literal_lookup_refresh(self) -> None:
+        """
+        Test that the CoreComputer's literal lookup is built lazily and that the lookup and the cached satisfiability
+        results are rebuilt after `refresh_lookup`.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a}.")
+        control.ground([("base", [])])
+        a, b = ((clingo.parse_term(c), True) for c in "ab")
+        cc = CoreComputer(control, {a, b})
+        self.assertEqual(set(cc.literal_lookup.values()), {clingo.parse_term("a")})
+        control.add("extra", [], "{b}.")
+        control.ground([("extra", [])])
+        self.assertEqual(set(cc.literal_lookup.values()), {clingo.parse_term("a")})
+        cc.refresh_lookup()
+        self.assertEqual(set(cc.literal_lookup.values()), {clingo.parse_term("a"), clingo.parse_term("b")})
+        cc.shrink()
+        self.assertEqual(cc.minimal, set())
+        control.add("constraint", [], ":- a, b.")
+        control.ground([("constraint", [])])
+        cc.refresh_lookup()
+        cc.shrink()
+        self.assertEqual(cc.minimal, {a, b})
+
+    def test_core_computer_internal_unsat_core(self) -> None:
+        """
+        Test that the CoreComputer's `_unsat_core` function maps the solver core back to the passed assumptions.
+        """
+
+        control = clingo.Control()
+        control.add("base", [], "{a; b; c}. :- a, not b.")
+        control.ground([("base", [])])
+        a, b, not_b, c, x, not_x = (
+            (clingo.parse_term("a"), True),
+            (clingo.parse_term("b"), True),
+            (clingo.parse_term("b"), False),
+            (clingo.parse_term("c"), True),
+            (clingo.parse_term("x"), True),
+            (clingo.parse_term("x"), False),
+        )
+        cc = CoreComputer(control, {a, not_b, c})
+        core = cc._unsat_core([a, not_b, c])  # pylint: disable=W0212
+        self.assertTrue({a, not_b}.issubset(core))
+        self.assertTrue(core.issubset({a, not_b, c}))
+        self.assertFalse(cc._is_satisfiable(core))  # pylint: disable=W0212
+        with self.assertRaises(ValueError):
+            cc._unsat_core([a, c])  # pylint: disable=W0212
+        # a positive assumption on a symbol that isn't part of the program is unsatisfiable on its own, while a
+        # negative one always holds
+        self.assertEqual(cc._unsat_core([a, b, x]), {x})  # pylint: disable=W0212
+        self.assertTrue(cc._is_satisfiable([a, b, not_x]))  # pylint: disable=W0212
+        cc = CoreComputer(control, {a, x})
+        cc.shrink()
+        self.assertEqual(cc.minimal, {x})
 
     def test_core_computer_internal_compute_single_minimal_satisfiable(self) -> None:
         """
@@ -2,9 +2,17 @@
 Tests for the utils package
 """
 
+from typing import List
 from unittest import TestCase
 
-from clingexplaid.utils import get_constant_string, get_constants_from_arguments, get_signatures_from_model_string
+import clingo.ast
+
+from clingexplaid.utils import (
+    get_ast_symbolic_atom_signature,
+    get_constant_string,
+    get_constants_from_arguments,
+    get_signatures_from_model_string,
+)
 
 
 class TestUtils(TestCase):
@@ -38,3 +46,12 @@ class TestUtils(TestCase):
             get_constant_string("123", "value")
         self.assertEqual(get_constant_string("name", "123", prefix="#const "), "#const name=123")
         self.assertEqual(get_constant_string("name", "123", prefix="-c "), "-c name=123")
+
+    def test_get_ast_symbolic_atom_signature(self) -> None:
+        """
+        Test getting the signature of AST symbolic atoms
+        """
+        statements: List[clingo.ast.AST] = []
+        clingo.ast.parse_string("a(1,2). b. c(d(1),e). -a(1). -b.", statements.append)
+        signatures = [get_ast_symbolic_atom_signature(statement.head.atom) for statement in statements[1:]]
+        self.assertEqual(signatures, [("a", 2), ("b", 0), ("c", 2), ("a", 1), ("b", 0)])